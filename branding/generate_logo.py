@@ -1,6 +1,6 @@
 """
 Generate an app logo SVG with a centered "P" and a circular ring around it, both filled with the app's 3-color gradient.
-Optionally rasterize PNGs at multiple sizes (requires cairosvg and pillow).
+Optionally rasterize PNGs at multiple sizes (requires resvg-py, librsvg's rsvg-convert, or cairosvg).
 
 Defaults follow the gradient used in the frontend: from indigo-600 via sky-600 to emerald-600.
 
@@ -17,13 +17,148 @@ Usage (Windows cmd):
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import io
 import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Default gradient colors (Tailwind): indigo-600, sky-600, emerald-600
 DEFAULT_COLORS = ("#4f46e5", "#0284c7", "#059669")
 
+# Static SVG markup, rendered with str.format_map. Numbers are pre-formatted with _f.
+_SVG_HEAD_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {s} {s}" role="img" aria-label="Periodix logo">\n'
+    "<defs>\n"
+    '    <linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="100%" y2="100%">\n'
+    "    {stops}\n"
+    "    </linearGradient>\n"
+    "</defs>\n"
+    "\n"
+    "<!-- Background transparent -->\n"
+    '<rect width="100%" height="100%" fill="none"/>\n'
+    "\n"
+    "<!-- Outer ring using stroke -->\n"
+    '<circle cx="{cx}" cy="{cy}" r="{r}" fill="none" stroke="url(#{gradient_id})" stroke-width="{stroke_width}" stroke-linecap="round"/>\n'
+    "\n"
+)
+_SVG_TAIL = "\n</svg>"
+
+_MANUAL_P_TEMPLATE = (
+    "\n<!-- P letter (manual path) -->\n"
+    '<path d="M {stem_x} {eff_bottom}\n'
+    "        L {stem_x} {eff_top}\n"
+    "        L {bowl_x} {eff_top}\n"
+    "        A {r} {r} 0 0 1 {bowl_x} {bowl_bottom_y}\n"
+    '        L {stem_x} {bowl_bottom_y}"\n'
+    '        fill="none" stroke="url(#{gradient_id})" stroke-width="{stroke_width}" stroke-linecap="round" stroke-linejoin="round"/>'
+)
+_MANUAL_U_TEMPLATE = (
+    "\n<!-- U letter (manual path) -->\n"
+    '<path d="M {left_x} {eff_top}\n'
+    "        L {left_x} {arc_y}\n"
+    "        A {r} {r} 0 0 0 {right_x} {arc_y}\n"
+    '        L {right_x} {eff_top}"\n'
+    '        fill="none" stroke="url(#{gradient_id})" stroke-width="{stroke_width}" stroke-linecap="round" stroke-linejoin="round"/>'
+)
+
+_TEXT_LETTER_FILL_TEMPLATE = (
+    "\n<!-- Letter (font text, filled) -->\n"
+    '<text x="{x}" y="{y}" text-anchor="middle" dominant-baseline="middle"\n'
+    '        font-family="{font_family}" font-size="{font_size}" dy="0.05em"\n'
+    '        fill="url(#{gradient_id})">{letter}</text>'
+)
+_TEXT_LETTER_STROKE_TEMPLATE = (
+    "\n<!-- Letter (font text, stroked) -->\n"
+    '<text x="{x}" y="{y}" text-anchor="middle" dominant-baseline="middle"\n'
+    '        font-family="{font_family}" font-size="{font_size}" dy="0.05em"\n'
+    '        fill="none" stroke="url(#{gradient_id})" stroke-width="{stroke_width}" stroke-linejoin="round" stroke-linecap="round">{letter}</text>'
+)
+
+# Glyph path data is appended between the open and close fragments without joining it first
+_GLYPH_LETTER_OPEN_TEMPLATE = (
+    "\n<!-- Letter (glyph path, {kind}) -->\n"
+    '<g transform="{transform}">\n'
+    '    <path d="'
+)
+_GLYPH_LETTER_FILL_TEMPLATE = '" fill="url(#{gradient_id})" />\n</g>'
+_GLYPH_LETTER_STROKE_TEMPLATE = '" fill="none" stroke="url(#{gradient_id})" stroke-width="{stroke_width}" stroke-linecap="round" stroke-linejoin="round"/>\n</g>'
+
+
+def _f(v: float) -> str:
+    """Compact number formatting for SVG output: at most 3 decimals, no trailing zeros."""
+    s = format(v, ".3f").rstrip("0").rstrip(".")
+    return "0" if s == "-0" else s
+
+
+# Optional dependencies, imported on first use (see _get_fonttools / _get_resvg / _get_svglib / _get_cairosvg)
+_cairosvg = None
+_resvg = None
+_svglib = None
+_TTFont = None
+_SVGPathPen = None
+
+
+def _get_fonttools():
+    global _TTFont, _SVGPathPen
+    if _TTFont is None:
+        try:
+            from fontTools.ttLib import TTFont  # type: ignore
+            from fontTools.pens.svgPathPen import SVGPathPen  # type: ignore
+        except Exception as e:  # pragma: no cover
+            raise RuntimeError("Glyph mode requires fontTools. Install with: pip install fonttools") from e
+        _TTFont, _SVGPathPen = TTFont, SVGPathPen
+    return _TTFont, _SVGPathPen
+
+
+def _get_resvg():
+    """Return the resvg_py module, or None if it is not installed."""
+    global _resvg
+    if _resvg is None:
+        try:
+            import resvg_py  # type: ignore
+        except Exception:
+            _resvg = False
+        else:
+            _resvg = resvg_py
+    return _resvg or None
+
+
+def _get_svglib():
+    """Return (svg2rlg, renderPM) from svglib/reportlab."""
+    global _svglib
+    if _svglib is None:
+        try:
+            import reportlab  # type: ignore
+            from svglib.svglib import svg2rlg  # type: ignore
+            from reportlab.graphics import renderPM  # type: ignore
+            # Since ReportLab 4, renderPM draws only through the separate rlPyCairo package
+            if int(reportlab.Version.split(".")[0]) >= 4:
+                import rlPyCairo  # type: ignore  # noqa: F401
+        except Exception as e:
+            raise RuntimeError(
+                "PNG backend 'svglib' requires 'svglib' and 'rlPyCairo'. Install with: pip install svglib rlPyCairo"
+            ) from e
+        _svglib = (svg2rlg, renderPM)
+    return _svglib
+
+
+def _get_cairosvg():
+    global _cairosvg
+    if _cairosvg is None:
+        try:
+            import cairosvg  # type: ignore
+        except Exception as e:
+            raise RuntimeError(
+                "PNG backend 'cairosvg' requires 'cairosvg'. Install with: pip install cairosvg"
+            ) from e
+        _cairosvg = cairosvg
+    return _cairosvg
+
 
 @dataclass
 class LogoSpec:
@@ -38,24 +173,51 @@ class LogoSpec:
     u_scale: float = 0.6
 
     def gradient_stops(self, colors: Iterable[str] = DEFAULT_COLORS) -> str:
+        # Colors are the same for every size in a run, so the markup is cached per colors tuple
+        return _gradient_stops(tuple(colors))
+
+
+@functools.lru_cache(maxsize=16)
+def _gradient_stops(colors: Tuple[str, ...]) -> str:
+    try:
+        # Common case: exactly three colors
+        c0, c1, c2 = colors
+    except ValueError:
         c = list(colors)
         if len(c) == 1:
             # Single color fallback: duplicate stops
             c = [c[0], c[0], c[0]]
         elif len(c) == 2:
             c = [c[0], c[1], c[1]]
-        # 3 stops at 0%, 50%, 100%
-        return "\n".join(
-            [
-                f'<stop offset="0%" stop-color="{c[0]}"/>',
-                f'<stop offset="50%" stop-color="{c[1]}"/>',
-                f'<stop offset="100%" stop-color="{c[2]}"/>'
-            ]
-        )
-
-
-def _manual_letter_path(spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, colors: Iterable[str], gradient_id: str) -> str:
-    """Original handmade path for the P (kept for backwards compatibility)."""
+        c0, c1, c2 = c[0], c[1], c[2]
+    # 3 stops at 0%, 50%, 100%
+    return (
+        f'<stop offset="0%" stop-color="{c0}"/>\n'
+        f'<stop offset="50%" stop-color="{c1}"/>\n'
+        f'<stop offset="100%" stop-color="{c2}"/>'
+    )
+
+
+def _manual_u_path(parts: List[str], cx: float, eff_top: float, eff_bottom: float, eff_w: float, eff_h: float, u_stroke: float, gradient_id: str) -> None:
+    """Handmade U path: two stems joined by a half circle, centered on cx."""
+    r = max(1.0, min(eff_w, eff_h) / 2.0 - u_stroke / 2.0)
+    left_x = cx - r
+    right_x = cx + r
+    # Keep the outer edge of the bottom curve inside the padded box
+    arc_y = max(eff_top, eff_bottom - r - u_stroke / 2.0)
+    parts.append(_MANUAL_U_TEMPLATE.format_map({
+        "left_x": _f(left_x),
+        "right_x": _f(right_x),
+        "eff_top": _f(eff_top),
+        "arc_y": _f(arc_y),
+        "r": _f(r),
+        "gradient_id": gradient_id,
+        "stroke_width": _f(u_stroke),
+    }))
+
+
+def _manual_letter_path(parts: List[str], spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, colors: Iterable[str], gradient_id: str, letter: str = "P") -> None:
+    """Original handmade path for the P (kept for backwards compatibility); "U" gets its own geometry."""
     s = spec.size
     # gap logic reused here (gap already applied when computing available_d below)
     # Compute available square inside inner circle after accounting for gap
@@ -74,6 +236,9 @@ def _manual_letter_path(spec: LogoSpec, cx: float, cy: float, ring_inner_r: floa
     eff_bottom = bottom_y - pad
     eff_w = max(1.0, eff_right - eff_left)
     eff_h = max(1.0, eff_bottom - eff_top)
+    if letter.upper() == "U":
+        _manual_u_path(parts, cx, eff_top, eff_bottom, eff_w, eff_h, u_stroke, gradient_id)
+        return
     stem_x = eff_left
     bowl_w = max(u_stroke * 2.0, eff_w * 0.60)
     x_right = eff_left + bowl_w
@@ -82,18 +247,19 @@ def _manual_letter_path(spec: LogoSpec, cx: float, cy: float, ring_inner_r: floa
     r = max(1.0, min(r_w, r_h) - (u_stroke / 2.0))
     bowl_bottom_y = eff_top + 2.0 * r
     bowl_bottom_y = min(bowl_bottom_y, eff_bottom - u_stroke / 2.0)
-    return f"""
-<!-- P letter (manual path) -->
-<path d="M {stem_x} {eff_bottom}
-        L {stem_x} {eff_top}
-        L {x_right - r} {eff_top}
-        A {r} {r} 0 0 1 {x_right - r} {bowl_bottom_y}
-        L {stem_x} {bowl_bottom_y}"
-        fill="none" stroke="url(#{gradient_id})" stroke-width="{u_stroke}" stroke-linecap="round" stroke-linejoin="round"/>
-""".rstrip()
-
-
-def _text_letter(spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, letter: str, gradient_id: str, fill_letter: bool) -> str:
+    parts.append(_MANUAL_P_TEMPLATE.format_map({
+        "stem_x": _f(stem_x),
+        "bowl_x": _f(x_right - r),
+        "eff_top": _f(eff_top),
+        "eff_bottom": _f(eff_bottom),
+        "bowl_bottom_y": _f(bowl_bottom_y),
+        "r": _f(r),
+        "gradient_id": gradient_id,
+        "stroke_width": _f(u_stroke),
+    }))
+
+
+def _text_letter(parts: List[str], spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, letter: str, gradient_id: str, fill_letter: bool) -> None:
         """Render the letter using an SVG <text> element.
 
         Centering: we rely on text-anchor and dominant-baseline. Some renderers differ,
@@ -105,77 +271,103 @@ def _text_letter(spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, lett
         # Fallback if extremely small
         font_size = max(font_size, stroke_w * 3)
 
-        if fill_letter:
-            return f"""
-<!-- Letter (font text, filled) -->
-<text x="{cx}" y="{cy}" text-anchor="middle" dominant-baseline="middle"
-        font-family="{spec.font_family}" font-size="{font_size}" dy="0.05em"
-        fill="url(#{gradient_id})">{letter}</text>
-""".rstrip()
-
-        return f"""
-<!-- Letter (font text, stroked) -->
-<text x="{cx}" y="{cy}" text-anchor="middle" dominant-baseline="middle"
-        font-family="{spec.font_family}" font-size="{font_size}" dy="0.05em"
-        fill="none" stroke="url(#{gradient_id})" stroke-width="{stroke_w}" stroke-linejoin="round" stroke-linecap="round">{letter}</text>
-""".rstrip()
-
-
-def _glyph_letter(spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, letter: str, gradient_id: str, font_file: str, glyph_center: str = "advance", fill_letter: bool = False) -> str:
-        """Convert the letter to an exact path using fontTools for perfect centering.
-        This avoids renderer differences in baseline handling.
-        """
-        try:
-            from fontTools.ttLib import TTFont  # type: ignore
-            from fontTools.pens.svgPathPen import SVGPathPen  # type: ignore
-        except Exception as e:  # pragma: no cover
-            raise RuntimeError("Glyph mode requires fontTools. Install with: pip install fonttools") from e
-
-        if not os.path.isfile(font_file):
-            raise FileNotFoundError(f"Font file not found: {font_file}")
-
-        font = TTFont(font_file)
-        cmap = font.getBestCmap()
-        codepoint = ord(letter)
-        if codepoint not in cmap:
-            raise ValueError(f"Letter '{letter}' not in font cmap")
-        glyph_name = cmap[codepoint]
-        glyph_set = font.getGlyphSet()
-        glyph = glyph_set[glyph_name]
-        pen = SVGPathPen(glyph_set)
-        glyph.draw(pen)
-        d = pen.getCommands()
-
-        # Try to get a reliable bounding box from the font 'glyf' table (TTF)
-        xmin = ymin = xmax = ymax = None
-        try:
-            glyf = font['glyf']
-            g_raw = glyf[glyph_name]
-            xmin = getattr(g_raw, "xMin", None)
-            ymin = getattr(g_raw, "yMin", None)
-            xmax = getattr(g_raw, "xMax", None)
-            ymax = getattr(g_raw, "yMax", None)
-        except Exception:
-            pass
-
-        if None in (xmin, ymin, xmax, ymax):
-            # Fallback: use font units per em as a safe square
-            units = font['head'].unitsPerEm
-            xmin, ymin, xmax, ymax = 0, 0, units, units
+        template = _TEXT_LETTER_FILL_TEMPLATE if fill_letter else _TEXT_LETTER_STROKE_TEMPLATE
+        parts.append(template.format_map({
+            "x": _f(cx),
+            "y": _f(cy),
+            "font_family": spec.font_family,
+            "font_size": _f(font_size),
+            "gradient_id": gradient_id,
+            "stroke_width": _f(stroke_w),
+            "letter": letter,
+        }))
+
+
+@dataclass(frozen=True)
+class _FontBundle:
+    font: Any
+    cmap: Dict[int, str]
+    glyph_set: Any
+    glyf: Any  # None for CFF-flavoured fonts
+    hmtx: Any
+    units_per_em: int
+
+
+@functools.lru_cache(maxsize=4)
+def _load_ttfont(font_file: str) -> _FontBundle:
+    """Parse a font file once and keep the tables needed for glyph extraction."""
+    TTFont, _ = _get_fonttools()
+
+    if not os.path.isfile(font_file):
+        raise FileNotFoundError(f"Font file not found: {font_file}")
+
+    font = TTFont(font_file)
+    return _FontBundle(font, font.getBestCmap(), font.getGlyphSet(), font.get('glyf'), font['hmtx'], font['head'].unitsPerEm)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_glyph(font_file: str, letter: str, glyph_center: str) -> Tuple[Tuple[str, ...], float, float, float, float]:
+    """Parse the font and extract the size-independent glyph data.
+
+    Returns (commands, center_x, center_y, width, height) in font units, where
+    commands are the path "d" fragments as produced by SVGPathPen. Cached per
+    glyph on top of the per-font cache in _load_ttfont.
+    """
+    _, SVGPathPen = _get_fonttools()
+    bundle = _load_ttfont(font_file)
+    cmap = bundle.cmap
+    codepoint = ord(letter)
+    if codepoint not in cmap:
+        raise ValueError(f"Letter '{letter}' not in font cmap")
+    glyph_name = cmap[codepoint]
+    glyph_set = bundle.glyph_set
+    glyph = glyph_set[glyph_name]
+    pen = SVGPathPen(glyph_set, ntos=_f)
+    glyph.draw(pen)
+    # Keep the pen's command fragments unjoined; make_svg joins everything once
+    commands = tuple(pen._commands)
+
+    # Try to get a reliable bounding box from the font 'glyf' table (TTF)
+    xmin = ymin = xmax = ymax = None
+    try:
+        g_raw = bundle.glyf[glyph_name]
+        xmin = getattr(g_raw, "xMin", None)
+        ymin = getattr(g_raw, "yMin", None)
+        xmax = getattr(g_raw, "xMax", None)
+        ymax = getattr(g_raw, "yMax", None)
+    except Exception:
+        pass
+
+    if None in (xmin, ymin, xmax, ymax):
+        # Fallback: use font units per em as a safe square
+        units = bundle.units_per_em
+        xmin, ymin, xmax, ymax = 0, 0, units, units
+
+    width = xmax - xmin
+    height = ymax - ymin
+
+    # Advance metrics for optional typographic centering
+    advance_width, lsb = bundle.hmtx[glyph_name]
+
+    # Compute optional horizontal centering delta
+    if glyph_center == "advance":
+        cx_outline = xmin + width / 2.0
+        cx_advance = advance_width / 2.0
+        delta_x = cx_advance - cx_outline
+    else:
+        delta_x = 0.0
 
-        width = xmax - xmin
-        height = ymax - ymin
+    # Glyph center (including advance delta) in font units
+    center_x = xmin + width / 2.0 + delta_x
+    center_y = ymin + height / 2.0
+    return commands, center_x, center_y, width, height
 
-        # Advance metrics for optional typographic centering
-        advance_width, lsb = font['hmtx'][glyph_name]
 
-        # Compute optional horizontal centering delta
-        if glyph_center == "advance":
-            cx_outline = xmin + width / 2.0
-            cx_advance = advance_width / 2.0
-            delta_x = cx_advance - cx_outline
-        else:
-            delta_x = 0.0
+def _glyph_letter(parts: List[str], spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, letter: str, gradient_id: str, font_file: str, glyph_center: str = "advance", fill_letter: bool = False) -> None:
+        """Convert the letter to an exact path using fontTools for perfect centering.
+        This avoids renderer differences in baseline handling.
+        """
+        commands, center_x, center_y, width, height = _load_glyph(font_file, letter, glyph_center)
 
         available_d = max(0.0, 2 * ring_inner_r - 2 * spec.gap)
         target = available_d * max(0.0, min(1.0, spec.u_scale))
@@ -183,32 +375,28 @@ def _glyph_letter(spec: LogoSpec, cx: float, cy: float, ring_inner_r: float, let
         scale = target / max(width, height, 1.0)
         stroke_w = max(1.0, spec.size * spec.u_weight_pct)
 
-        # Compute glyph center (including advance delta) and build transform so glyph center maps to (cx,cy)
-        center_x = xmin + width / 2.0 + delta_x
-        center_y = ymin + height / 2.0
+        # Build transform so glyph center maps to (cx,cy)
         # transform: translate(cx, cy) scale(scale, -scale) translate(-center_x, -center_y)
-        transform = f"translate({cx},{cy}) scale({scale}, {-scale}) translate({-center_x},{-center_y})"
+        # scale is tiny (font units -> px), so it keeps significant digits rather than fixed decimals
+        scale_s = format(scale, ".6g")
+        transform = f"translate({_f(cx)},{_f(cy)}) scale({scale_s}, -{scale_s}) translate({_f(-center_x)},{_f(-center_y)})"
 
         if fill_letter:
-            return f"""
-<!-- Letter (glyph path, filled) -->
-<g transform="{transform}">
-    <path d="{d}" fill="url(#{gradient_id})" />
-</g>
-""".rstrip()
+            parts.append(_GLYPH_LETTER_OPEN_TEMPLATE.format_map({"kind": "filled", "transform": transform}))
+            parts.extend(commands)
+            parts.append(_GLYPH_LETTER_FILL_TEMPLATE.format_map({"gradient_id": gradient_id}))
+            return
 
         # For stroked outlines we need to compensate stroke width for the applied scale
         # The stroke attribute is in pre-transform user units, so divide by scale to get desired final px width
         stroke_attr = max(0.5, stroke_w / max(scale, 1e-6))
-        return f"""
-<!-- Letter (glyph path, stroked) -->
-<g transform="{transform}">
-    <path d="{d}" fill="none" stroke="url(#{gradient_id})" stroke-width="{stroke_attr}" stroke-linecap="round" stroke-linejoin="round"/>
-</g>
-""".rstrip()
+        parts.append(_GLYPH_LETTER_OPEN_TEMPLATE.format_map({"kind": "stroked", "transform": transform}))
+        parts.extend(commands)
+        parts.append(_GLYPH_LETTER_STROKE_TEMPLATE.format_map({"gradient_id": gradient_id, "stroke_width": _f(stroke_attr)}))
 
 
-def make_svg(spec: LogoSpec, colors: Iterable[str] = DEFAULT_COLORS, letter: str = "P", letter_mode: str = "manual", font_file: Optional[str] = None, glyph_center: str = "advance", fill_letter: bool = False) -> str:
+def _svg_parts(spec: LogoSpec, colors: Iterable[str] = DEFAULT_COLORS, letter: str = "P", letter_mode: str = "manual", font_file: Optional[str] = None, glyph_center: str = "advance", fill_letter: bool = False) -> List[str]:
+        """Build the SVG as a list of string fragments (glyph path data is shared with the glyph cache)."""
         s = spec.size
         cx = cy = s / 2
         # Make the ring hug the SVG bounds: outer edge is (s/2 - margin)
@@ -216,61 +404,155 @@ def make_svg(spec: LogoSpec, colors: Iterable[str] = DEFAULT_COLORS, letter: str
         ring_inner_r = max(0.0, ring_outer_r - spec.ring_thickness)
 
         gradient_id = "grad"
+        stops = spec.gradient_stops(colors)
+
+        parts: List[str] = [_SVG_HEAD_TEMPLATE.format_map({
+            "s": s,
+            "gradient_id": gradient_id,
+            "stops": stops,
+            "cx": _f(cx),
+            "cy": _f(cy),
+            "r": _f((ring_outer_r + ring_inner_r) / 2),
+            "stroke_width": _f(ring_outer_r - ring_inner_r),
+        })]
+
+        if letter_mode == "manual":
+            _manual_letter_path(parts, spec, cx, cy, ring_inner_r, colors, gradient_id, letter)
+        elif letter_mode == "text":
+            _text_letter(parts, spec, cx, cy, ring_inner_r, letter, gradient_id, fill_letter)
+        else:
+            _glyph_letter(parts, spec, cx, cy, ring_inner_r, letter, gradient_id, font_file or "", glyph_center, fill_letter)
+
+        parts.append(_SVG_TAIL)
+        return parts
+
+
+def make_svg(spec: LogoSpec, colors: Iterable[str] = DEFAULT_COLORS, letter: str = "P", letter_mode: str = "manual", font_file: Optional[str] = None, glyph_center: str = "advance", fill_letter: bool = False) -> str:
+        return "".join(_svg_parts(spec, colors, letter, letter_mode, font_file, glyph_center, fill_letter))
+
+
+def _iter_svg(spec: LogoSpec, colors: Iterable[str] = DEFAULT_COLORS, letter: str = "P", letter_mode: str = "manual", font_file: Optional[str] = None, glyph_center: str = "advance", fill_letter: bool = False) -> Iterator[bytes]:
+        """Yield the SVG as UTF-8 encoded fragments without ever joining the whole document."""
+        for part in _svg_parts(spec, colors, letter, letter_mode, font_file, glyph_center, fill_letter):
+            yield part.encode("utf-8")
+
 
-        svg = f"""
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {s} {s}" role="img" aria-label="Periodix logo">
-<defs>
-    <linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="100%" y2="100%">
-    {spec.gradient_stops(colors)}
-    </linearGradient>
-    <!-- Create a gradient stroke via a path painted once -->
-    <linearGradient id="{gradient_id}-stroke" x1="0%" y1="0%" x2="100%" y2="100%">
-    {spec.gradient_stops(colors)}
-    </linearGradient>
-</defs>
-
-<!-- Background transparent -->
-<rect width="100%" height="100%" fill="none"/>
-
-<!-- Outer ring using stroke -->
-<circle cx="{cx}" cy="{cy}" r="{(ring_outer_r + ring_inner_r)/2}" fill="none" stroke="url(#{gradient_id}-stroke)" stroke-width="{(ring_outer_r - ring_inner_r)}" stroke-linecap="round"/>
-
-{(
-        _manual_letter_path(spec, cx, cy, ring_inner_r, colors, gradient_id)
-        if letter_mode == "manual"
-    else _text_letter(spec, cx, cy, ring_inner_r, letter, gradient_id, fill_letter)
-        if letter_mode == "text"
-    else _glyph_letter(spec, cx, cy, ring_inner_r, letter, gradient_id, font_file or "", glyph_center, fill_letter)
-    )}
-</svg>
-""".strip()
-
-        return svg
-
-
-def write_svg(path: str, content: str) -> None:
+def _prepare_output(path: str) -> None:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
+        # logo.svg may be a hard link to a size variant; never write through the shared inode
+        if os.path.exists(path) and os.stat(path).st_nlink > 1:
+            os.unlink(path)
+
+
+def write_svg(path: str, content: str | bytes) -> None:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        _prepare_output(path)
+        # Pre-encoded bytes go out in a single unbuffered write
+        with open(path, "wb", buffering=0) as f:
             f.write(content)
 
 
-def export_pngs(svg_content: str, size: int, out_path: str) -> None:
+def write_svg_stream(path: str, fragments: Iterable[bytes]) -> None:
+        # os.replace swaps in a new inode, so a hard-linked logo.svg is never written through
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Fragments are generated lazily; only replace the old file once they all succeeded
+        tmp = path + ".tmp"
         try:
-            import cairosvg  # type: ignore
-        except Exception as e:
-            raise RuntimeError(
-                "PNG export requires 'cairosvg'. Install with: pip install cairosvg"
-            ) from e
+            with open(tmp, "wb", buffering=65536) as f:
+                f.writelines(fragments)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+
+def _ensure_linked(src: str, dst: str) -> None:
+        """Make dst a hard link to src, falling back to a copy (e.g. cross-device or unsupported FS)."""
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            return
+        tmp = dst + ".tmp"
+        try:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            os.link(src, tmp)
+            os.replace(tmp, dst)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            shutil.copyfile(src, dst)
+
 
-        # Export exact size raster
-        cairosvg.svg2png(bytestring=svg_content.encode("utf-8"), write_to=out_path, output_width=size, output_height=size, background_color=None)
+def _rasterize_svglib(svg_bytes: bytes, size: int, out_path: str) -> None:
+        svg2rlg, renderPM = _get_svglib()
+        drawing = svg2rlg(io.BytesIO(svg_bytes))
+        # svglib sizes the drawing in points; renderPM renders one pixel per point at 72 dpi
+        renderPM.drawToFile(drawing, out_path, fmt="PNG", dpi=72 * size / drawing.width)
+
+
+def _rasterize(svg_bytes: bytes, size: int, out_path: str, backend: str = "auto") -> None:
+        """Render an exact size PNG with the given backend.
+
+        "auto" prefers resvg, then librsvg, then cairosvg.
+        """
+        if backend in ("auto", "resvg"):
+            resvg = _get_resvg()
+            if resvg is not None:
+                png = resvg.svg_to_bytes(svg_string=svg_bytes.decode("utf-8"), width=size, height=size)
+                with open(out_path, "wb") as f:
+                    f.write(bytes(png))
+                return
+            if backend == "resvg":
+                raise RuntimeError("PNG backend 'resvg' requires 'resvg-py'. Install with: pip install resvg-py")
+
+        if backend in ("auto", "rsvg-convert"):
+            rsvg_convert = shutil.which("rsvg-convert")
+            if rsvg_convert:
+                subprocess.run([rsvg_convert, "-w", str(size), "-h", str(size), "-o", out_path, "-"], input=svg_bytes, check=True)
+                return
+            if backend == "rsvg-convert":
+                raise RuntimeError("PNG backend 'rsvg-convert' requires librsvg's 'rsvg-convert' on PATH")
+
+        if backend == "svglib":
+            _rasterize_svglib(svg_bytes, size, out_path)
+            return
+
+        try:
+            cairosvg = _get_cairosvg()
+        except RuntimeError as e:
+            if backend == "auto":
+                raise RuntimeError(
+                    "PNG export requires 'resvg-py', 'rsvg-convert' or 'cairosvg'. Install with: pip install resvg-py"
+                ) from e
+            raise
+        cairosvg.svg2png(bytestring=svg_bytes, write_to=out_path, output_width=size, output_height=size, background_color=None)
+
+
+def export_pngs(svg_bytes: bytes, size: int, out_path: str, backend: str = "auto") -> bool:
+        """Rasterize the UTF-8 encoded SVG to out_path. Returns False if the existing PNG was already up to date."""
+        # Sidecar stamp records which SVG/size/backend produced the current PNG
+        h = hashlib.blake2b(svg_bytes, digest_size=16)
+        h.update(f"@{size}:{backend}".encode("ascii"))
+        digest = h.hexdigest()
+        stamp_path = out_path + ".stamp"
+        if os.path.exists(out_path) and os.path.exists(stamp_path):
+            with open(stamp_path, "r", encoding="ascii") as f:
+                if f.read().strip() == digest:
+                    return False
+
+        _rasterize(svg_bytes, size, out_path, backend)
+        with open(stamp_path, "w", encoding="ascii") as f:
+            f.write(digest)
+        return True
 
 
 def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         p = argparse.ArgumentParser(description="Generate SVG/PNGs for the Periodix logo")
         p.add_argument("--sizes", type=int, nargs="*", default=[256, 512, 1024], help="Output sizes in px (canvas width/height)")
         p.add_argument("--out", type=str, default="branding/dist", help="Output directory")
-        p.add_argument("--png", action="store_true", help="Also export PNGs for each size (requires cairosvg)")
+        p.add_argument("--png", action="store_true", help="Also export PNGs for each size (see --png-backend)")
+        p.add_argument("--png-backend", choices=["auto", "resvg", "rsvg-convert", "svglib", "cairosvg"], default="auto", help="PNG rasterizer: auto = resvg-py, then rsvg-convert, then cairosvg. svglib renders through reportlab onto an opaque white background")
         p.add_argument("--colors", type=str, nargs="*", default=list(DEFAULT_COLORS), help="Three hex colors for the gradient")
         p.add_argument("--ring", type=float, default=12.0, help="Ring thickness in px")
         p.add_argument("--ring-margin", type=float, default=8.0, help="Margin from SVG edge to ring outer edge in px")
@@ -279,7 +561,7 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         p.add_argument("--uscale", type=float, default=0.6, help="Overall letter size relative to inner circle area (0-1)")
         p.add_argument("--only-canonical", action="store_true", help="Write only a single 'logo.svg' without size-suffixed variants")
         p.add_argument("--profile", choices=["default", "icon"], default="default", help="Profile preset: 'icon' gives thicker ring & smaller letter for app icons")
-        p.add_argument("--letter", type=str, default="P", help="Letter to render (single character)")
+        p.add_argument("--letter", type=str, default="P", help="Letter to render (single character). Manual mode draws P or U")
         p.add_argument("--letter-mode", choices=["manual", "text", "glyph"], default="text", help="How to render the central letter")
         p.add_argument("--font-file", type=str, default="", help="Font file path for glyph mode (e.g. path/to/Inter-SemiBold.ttf)")
         p.add_argument("--glyph-center", choices=["outline", "advance"], default="advance", help="Glyph mode horizontal centering: outline = geometric bbox center, advance = typographic advance center")
@@ -287,6 +569,44 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         return p.parse_args(argv)
 
 
+def _resolve_spec(s: int, args: argparse.Namespace) -> LogoSpec:
+    """Build the LogoSpec for one size, applying the profile overrides if requested."""
+    if args.profile == "icon":
+        ring_thickness = s * 0.09
+        ring_margin = s * 0.06
+        u_scale = 0.50
+        u_weight_pct = 0.10
+        gap = max(4.0, s * 0.035)
+    else:
+        ring_thickness = args.ring
+        ring_margin = args.ring_margin
+        u_scale = args.uscale
+        u_weight_pct = args.uweight
+        gap = args.gap
+
+    return LogoSpec(size=s, ring_thickness=ring_thickness, ring_margin=ring_margin, gap=gap, u_weight_pct=u_weight_pct, u_scale=u_scale)
+
+
+def _render_one(s: int, args: argparse.Namespace, colors: Tuple[str, ...]) -> List[str]:
+    """Write the size-suffixed SVG (and PNG) for one size. Returns the written paths."""
+    spec = _resolve_spec(s, args)
+    svg_path = os.path.join(args.out, f"logo_{s}.svg")
+    written = [svg_path]
+    if not args.png:
+        write_svg_stream(svg_path, _iter_svg(spec, colors, letter=args.letter, letter_mode=args.letter_mode, font_file=args.font_file or None, glyph_center=args.glyph_center, fill_letter=args.fill_letter))
+        return written
+
+    # The rasterizer needs the whole document, so encode it once and share it
+    svg = make_svg(spec, colors, letter=args.letter, letter_mode=args.letter_mode, font_file=args.font_file or None, glyph_center=args.glyph_center, fill_letter=args.fill_letter)
+    svg_bytes = svg.encode("utf-8")
+    write_svg(svg_path, svg_bytes)
+
+    png_path = os.path.join(args.out, f"logo_{s}.png")
+    if export_pngs(svg_bytes, s, png_path, args.png_backend):
+        written.append(png_path)
+    return written
+
+
 def main() -> None:
     args = parse_args()
 
@@ -297,58 +617,35 @@ def main() -> None:
     if args.only_canonical:
         s = max(sizes) if sizes else 512
         spec = LogoSpec(size=s, ring_thickness=args.ring, ring_margin=args.ring_margin, gap=args.gap, u_weight_pct=args.uweight, u_scale=args.uscale)
-        svg = make_svg(spec, colors, letter=args.letter, letter_mode=args.letter_mode, font_file=args.font_file or None, glyph_center=args.glyph_center, fill_letter=args.fill_letter)
         svg_path = os.path.join(args.out, "logo.svg")
-        write_svg(svg_path, svg)
+        write_svg_stream(svg_path, _iter_svg(spec, colors, letter=args.letter, letter_mode=args.letter_mode, font_file=args.font_file or None, glyph_center=args.glyph_center, fill_letter=args.fill_letter))
         print(f"Wrote {svg_path}")
         return
 
     # Otherwise, write variants plus a canonical convenience file
     largest = max(sizes) if sizes else 512
 
-    for s in sizes:
-        # Apply profile overrides per size if requested
-        if args.profile == "icon":
-            ring_thickness = s * 0.09
-            ring_margin = s * 0.06
-            u_scale = 0.50
-            u_weight_pct = 0.10
-            gap = max(4.0, s * 0.035)
-        else:
-            ring_thickness = args.ring
-            ring_margin = args.ring_margin
-            u_scale = args.uscale
-            u_weight_pct = args.uweight
-            gap = args.gap
-
-        spec = LogoSpec(size=s, ring_thickness=ring_thickness, ring_margin=ring_margin, gap=gap, u_weight_pct=u_weight_pct, u_scale=u_scale)
-        svg = make_svg(spec, colors, letter=args.letter, letter_mode=args.letter_mode, font_file=args.font_file or None, glyph_center=args.glyph_center, fill_letter=args.fill_letter)
-        svg_path = os.path.join(args.out, f"logo_{s}.svg")
-        write_svg(svg_path, svg)
-        print(f"Wrote {svg_path}")
-
-        if args.png:
-            png_path = os.path.join(args.out, f"logo_{s}.png")
-            export_pngs(svg, s, png_path)
-            print(f"Wrote {png_path}")
-
-    if args.profile == "icon":
-        ring_thickness = largest * 0.09
-        ring_margin = largest * 0.06
-        u_scale = 0.50
-        u_weight_pct = 0.10
-        gap = max(4.0, largest * 0.035)
+    # Sizes are independent. Only PNG rasterization is heavy enough to pay for worker
+    # startup (and for re-parsing the font per worker); SVG-only runs stay serial.
+    render = functools.partial(_render_one, args=args, colors=colors)
+    cpus = os.cpu_count() or 1
+    if args.png and len(sizes) > 1 and cpus > 1:
+        with ProcessPoolExecutor(max_workers=min(len(sizes), cpus)) as ex:
+            results = list(ex.map(render, sizes))
     else:
-        ring_thickness = args.ring
-        ring_margin = args.ring_margin
-        u_scale = args.uscale
-        u_weight_pct = args.uweight
-        gap = args.gap
+        results = [render(s) for s in sizes]
+    for written in results:
+        for path in written:
+            print(f"Wrote {path}")
 
-    spec = LogoSpec(size=largest, ring_thickness=ring_thickness, ring_margin=ring_margin, gap=gap, u_weight_pct=u_weight_pct, u_scale=u_scale)
-    svg = make_svg(spec, colors, letter=args.letter, letter_mode=args.letter_mode, font_file=args.font_file or None, glyph_center=args.glyph_center, fill_letter=args.fill_letter)
     svg_path = os.path.join(args.out, "logo.svg")
-    write_svg(svg_path, svg)
+    if sizes:
+        # The canonical file is identical to the largest variant; link it instead of rewriting
+        _ensure_linked(os.path.join(args.out, f"logo_{largest}.svg"), svg_path)
+    else:
+        # No sizes were requested, so nothing was rendered yet
+        spec = _resolve_spec(largest, args)
+        write_svg_stream(svg_path, _iter_svg(spec, colors, letter=args.letter, letter_mode=args.letter_mode, font_file=args.font_file or None, glyph_center=args.glyph_center, fill_letter=args.fill_letter))
     print(f"Wrote {svg_path}")
 
 